@@ -4,12 +4,23 @@ Author: GitHub Copilot
 Purpose: Analyze dataset for multi-tenant e-commerce SaaS (Authors as Tenants)
 """
 
+import os
+import sys
+
 import pandas as pd
+import polars as pl
 import numpy as np
+import matplotlib
+
+# Headless runs (CI, cron) skip the interactive backend entirely
+if os.environ.get("EDA_HEADLESS"):
+    matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 import seaborn as sns
+import numba
 import warnings
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 import re
 from wordcloud import WordCloud
 from datetime import datetime
@@ -17,43 +28,237 @@ import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
+# Optional GPU acceleration for the heavy groupbys
+try:
+    import cudf
+
+    _HAS_GPU = True
+except ImportError:
+    _HAS_GPU = False
+
 # Configuration
 warnings.filterwarnings("ignore")
 plt.style.use("seaborn-v0_8")
 sns.set_palette("husl")
 
 
+@numba.njit(cache=True, parallel=True)
+def _clean_range(x, lo, hi):
+    """Single fused pass: NaN check + strict (lo, hi) range mask."""
+    out = np.empty(x.size, np.float64)
+    ok = np.empty(x.size, np.bool_)
+    for i in numba.prange(x.size):
+        v = x[i]
+        out[i] = v
+        ok[i] = (v == v) and (lo < v < hi)
+    return out, ok
+
+
+def _missing_pct(df):
+    """Share of missing cells, one NumPy reduction per column.
+
+    Avoids isnull().sum().sum(), which materializes a frame-sized boolean
+    copy and reduces it twice.
+    """
+    missing = sum(np.count_nonzero(pd.isna(df[col].to_numpy())) for col in df.columns)
+    return missing / df.size * 100
+
+
 class BookRecommendationEDA:
     """Complete EDA for Book Recommendation Dataset"""
 
-    def __init__(self, dataset_path):
-        """Initialize with dataset path"""
+    def __init__(self, dataset_path, render=True, dpi=150, streaming=False):
+        """Initialize with dataset path and rendering/memory options"""
         self.dataset_path = dataset_path
+        self.render = render
+        self.dpi = dpi
+        self.streaming = streaming
         self.books_df = None
         self.users_df = None
         self.ratings_df = None
+        self.rated_ratings_df = None
         self.merged_df = None
+        # Lazily computed aggregates shared across analysis steps
+        # (pre-filled by the chunked scan when streaming=True)
+        self._author_stats = None
+        self._user_activity = None
+        self._book_popularity = None
+        self._rating_dist = None
+        self._per_isbn_moments = None
+        self._n_ratings = None
+        self._n_active_ratings = None
+
+    @staticmethod
+    def _print_lines(lines):
+        """Emit pre-formatted report lines with one stdout write"""
+        lines = list(lines)
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
+
+    def _get_author_stats(self):
+        """Books per author, computed once and reused across methods"""
+        if self._author_stats is None:
+            self._author_stats = self.books_df["Book-Author"].value_counts()
+        return self._author_stats
+
+    def _get_user_activity(self):
+        """Ratings per user, computed once and reused across methods"""
+        if self._user_activity is None:
+            self._user_activity = self.ratings_df["User-ID"].value_counts()
+        return self._user_activity
+
+    def _get_book_popularity(self):
+        """Ratings per book, computed once and reused across methods"""
+        if self._book_popularity is None:
+            self._book_popularity = self.ratings_df["ISBN"].value_counts()
+        return self._book_popularity
+
+    def _get_rating_dist(self):
+        """Rating-value distribution, computed once and reused"""
+        if self._rating_dist is None:
+            self._rating_dist = (
+                self.ratings_df["Book-Rating"].value_counts().sort_index()
+            )
+        return self._rating_dist
+
+    def _stream_ratings_aggregate(self, chunksize=1_000_000):
+        """Reduce Ratings.csv to its aggregates in one chunked scan.
+
+        Memory-constrained alternative to materializing the full frame:
+        each chunk is reduced to user-activity, book-popularity and
+        rating-distribution counts plus per-ISBN (count, sum,
+        sum-of-squares) moments, and the partials are combined as the
+        scan goes. Peak memory is bounded by the number of distinct
+        users/ISBNs instead of rating rows, and everything the later
+        analysis steps need is pre-filled on the instance.
+        """
+
+        def _combine(total, partial):
+            return partial if total is None else total.add(partial, fill_value=0)
+
+        user_activity = book_popularity = rating_dist = moments = None
+        n_rows = 0
+        for chunk in pd.read_csv(
+            f"{self.dataset_path}/Ratings.csv",
+            encoding="latin-1",
+            dtype={"Book-Rating": "uint8", "User-ID": "uint32"},
+            chunksize=chunksize,
+        ):
+            n_rows += len(chunk)
+            user_activity = _combine(user_activity, chunk["User-ID"].value_counts())
+            book_popularity = _combine(book_popularity, chunk["ISBN"].value_counts())
+            rating_dist = _combine(rating_dist, chunk["Book-Rating"].value_counts())
+            rated = chunk[chunk["Book-Rating"] > 0]
+            moments = _combine(
+                moments,
+                rated.assign(rating_sq=rated["Book-Rating"].astype("float64") ** 2)
+                .groupby("ISBN", sort=False)
+                .agg(
+                    n=("Book-Rating", "size"),
+                    s=("Book-Rating", "sum"),
+                    s2=("rating_sq", "sum"),
+                ),
+            )
+
+        moments["n"] = moments["n"].astype("int64")
+        self._user_activity = user_activity.astype("int64").sort_values(
+            ascending=False
+        )
+        self._book_popularity = book_popularity.astype("int64").sort_values(
+            ascending=False
+        )
+        self._rating_dist = rating_dist.astype("int64").sort_index()
+        self._per_isbn_moments = moments
+        self._n_ratings = n_rows
+        self._n_active_ratings = int(moments["n"].sum())
+
+    def _finish_figure(self, filename):
+        """Save the current figure; only show it on interactive backends"""
+        plt.savefig(filename, dpi=self.dpi, bbox_inches="tight")
+        if matplotlib.get_backend().lower() != "agg":
+            plt.show()
+        plt.close()
 
     def load_data(self):
         """Load all three CSV files"""
         print("📚 Loading Book Recommendation Dataset...")
         print("=" * 50)
 
+        def _read(name, **kwargs):
+            """Parse one CSV (polars: multi-threaded, Arrow-backed strings)"""
+            return pl.read_csv(
+                f"{self.dataset_path}/{name}",
+                encoding="latin-1",
+                infer_schema_length=10000,
+                ignore_errors=True,
+                **kwargs,
+            ).to_pandas(use_pyarrow_extension_array=True)
+
         try:
-            # Load datasets
-            self.books_df = pd.read_csv(
-                f"{self.dataset_path}/Books.csv", encoding="latin-1", low_memory=False
-            )
-            self.users_df = pd.read_csv(
-                f"{self.dataset_path}/Users.csv", encoding="latin-1"
-            )
-            self.ratings_df = pd.read_csv(
-                f"{self.dataset_path}/Ratings.csv", encoding="latin-1"
+            # The three parses are independent, so overlap their I/O and
+            # GIL-releasing parser work in a small thread pool.
+            # Projection pushdown for books: the three Image-URL-* columns
+            # are never used downstream, so skip them at parse time.
+            # In streaming mode the ratings file is reduced to its
+            # aggregates on the fly instead of being materialized.
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                books_future = executor.submit(
+                    _read,
+                    "Books.csv",
+                    columns=[
+                        "ISBN",
+                        "Book-Title",
+                        "Book-Author",
+                        "Year-Of-Publication",
+                        "Publisher",
+                    ],
+                )
+                users_future = executor.submit(_read, "Users.csv")
+                if self.streaming:
+                    ratings_future = executor.submit(self._stream_ratings_aggregate)
+                else:
+                    ratings_future = executor.submit(_read, "Ratings.csv")
+                self.books_df = books_future.result()
+                self.users_df = users_future.result()
+                if self.streaming:
+                    ratings_future.result()
+                else:
+                    self.ratings_df = ratings_future.result()
+
+            # Dictionary-encode the heavy string keys once so every later
+            # value_counts/groupby/merge works on integer codes instead of
+            # re-hashing Python strings
+            self.books_df["Book-Author"] = self.books_df["Book-Author"].fillna(
+                "Unknown Author"
             )
+            for col in ("ISBN", "Book-Author", "Publisher"):
+                self.books_df[col] = self.books_df[col].astype("category")
+            self.books_df["Year-Of-Publication"] = pd.to_numeric(
+                self.books_df["Year-Of-Publication"], errors="coerce"
+            ).astype("UInt16")
+
+            if not self.streaming:
+                # Downcast numerics: ratings are 0-10 (uint8), user ids
+                # fit uint32
+                self.ratings_df["ISBN"] = self.ratings_df["ISBN"].astype("category")
+                self.ratings_df["Book-Rating"] = self.ratings_df[
+                    "Book-Rating"
+                ].astype(np.uint8)
+                self.ratings_df["User-ID"] = self.ratings_df["User-ID"].astype(
+                    np.uint32
+                )
+
+                # The positive-rating subset is shared by several analyses;
+                # slice it once instead of re-scanning the frame in each
+                self.rated_ratings_df = self.ratings_df[
+                    self.ratings_df["Book-Rating"].to_numpy() > 0
+                ]
+                self._n_ratings = len(self.ratings_df)
+                self._n_active_ratings = len(self.rated_ratings_df)
 
             print(f"✅ Books loaded: {len(self.books_df):,} records")
             print(f"✅ Users loaded: {len(self.users_df):,} records")
-            print(f"✅ Ratings loaded: {len(self.ratings_df):,} records")
+            print(f"✅ Ratings loaded: {self._n_ratings:,} records")
 
         except Exception as e:
             print(f"❌ Error loading data: {e}")
@@ -88,13 +293,18 @@ class BookRecommendationEDA:
 
         # Ratings dataset info
         print("\n⭐ RATINGS DATASET:")
-        print(f"Shape: {self.ratings_df.shape}")
-        print(f"Columns: {list(self.ratings_df.columns)}")
-        print("\nSample data:")
-        print(self.ratings_df.head(3))
-
-        print(f"\nMissing values:")
-        print(self.ratings_df.isnull().sum())
+        if self.ratings_df is not None:
+            print(f"Shape: {self.ratings_df.shape}")
+            print(f"Columns: {list(self.ratings_df.columns)}")
+            print("\nSample data:")
+            print(self.ratings_df.head(3))
+
+            print(f"\nMissing values:")
+            print(self.ratings_df.isnull().sum())
+        else:
+            print(f"Shape: ({self._n_ratings:,}, 3)")
+            print("Columns: ['User-ID', 'ISBN', 'Book-Rating']")
+            print("(streaming mode: raw rating rows are not retained)")
 
     def analyze_books_for_tenancy(self):
         """Analyze books dataset focusing on author-tenant perspective"""
@@ -107,7 +317,7 @@ class BookRecommendationEDA:
         )
 
         # Author statistics (potential tenants)
-        author_stats = self.books_df["Book-Author"].value_counts()
+        author_stats = self._get_author_stats()
 
         print(f"📊 AUTHOR STATISTICS:")
         print(f"Total unique authors (potential tenants): {len(author_stats):,}")
@@ -115,8 +325,10 @@ class BookRecommendationEDA:
         print(f"Median books per author: {author_stats.median():.0f}")
 
         print(f"\n🔥 TOP 20 AUTHORS BY BOOK COUNT (Top Tenants):")
-        for i, (author, count) in enumerate(author_stats.head(20).items(), 1):
-            print(f"{i:2d}. {author:<30} : {count:3d} books")
+        self._print_lines(
+            f"{i:2d}. {author:<30} : {count:3d} books"
+            for i, (author, count) in enumerate(author_stats.head(20).items(), 1)
+        )
 
         # Author distribution analysis
         print(f"\n📈 AUTHOR DISTRIBUTION ANALYSIS:")
@@ -145,58 +357,68 @@ class BookRecommendationEDA:
 
         if len(super_authors_list) > 0:
             print(f"\nComplete list of authors with 50+ books:")
-            for i, (author, count) in enumerate(super_authors_list.items(), 1):
-                print(f"{i:2d}. {author:<40} : {count:3d} books")
+            self._print_lines(
+                f"{i:2d}. {author:<40} : {count:3d} books"
+                for i, (author, count) in enumerate(super_authors_list.items(), 1)
+            )
         else:
             print("   No authors found with 50+ books in this dataset")
 
         # ...existing code...
         # Visualize author distribution
-        plt.figure(figsize=(15, 10))
-
-        plt.subplot(2, 2, 1)
-        author_stats.head(20).plot(kind="bar")
-        plt.title("Top 20 Authors by Book Count")
-        plt.xlabel("Authors")
-        plt.ylabel("Number of Books")
-        plt.xticks(rotation=45, ha="right")
-
-        plt.subplot(2, 2, 2)
-        books_per_author_dist = author_stats.value_counts().head(20)
-        books_per_author_dist.plot(kind="bar")
-        plt.title("Distribution: How Many Authors Have X Books")
-        plt.xlabel("Number of Books")
-        plt.ylabel("Number of Authors")
-
-        plt.subplot(2, 2, 3)
-        # Author categories
-        categories = ["1 book", "2-9 books", "10-49 books", "50+ books"]
-        values = [
-            single_book_authors,
-            multi_book_authors - prolific_authors,
-            prolific_authors - super_authors,
-            super_authors,
-        ]
-        plt.pie(values, labels=categories, autopct="%1.1f%%")
-        plt.title("Author Categories Distribution")
-
-        plt.subplot(2, 2, 4)
-        # Books per decade
-        self.books_df["Year-Of-Publication"] = pd.to_numeric(
-            self.books_df["Year-Of-Publication"], errors="coerce"
-        )
-        valid_years = self.books_df["Year-Of-Publication"].dropna()
-        valid_years = valid_years[(valid_years >= 1900) & (valid_years <= 2023)]
+        if self.render:
+            plt.figure(figsize=(15, 10))
+
+            plt.subplot(2, 2, 1)
+            author_stats.head(20).plot(kind="bar")
+            plt.title("Top 20 Authors by Book Count")
+            plt.xlabel("Authors")
+            plt.ylabel("Number of Books")
+            plt.xticks(rotation=45, ha="right")
+
+            plt.subplot(2, 2, 2)
+            # "How many authors have X books": the counts are small ints, so
+            # bincount-and-slice beats hashing them through value_counts
+            counts = author_stats.to_numpy()
+            hist = np.bincount(counts, minlength=counts.max() + 1)
+            books_per_author_dist = pd.Series(hist).sort_values(ascending=False).head(20)
+            books_per_author_dist.plot(kind="bar")
+            plt.title("Distribution: How Many Authors Have X Books")
+            plt.xlabel("Number of Books")
+            plt.ylabel("Number of Authors")
+
+            plt.subplot(2, 2, 3)
+            # Author categories
+            categories = ["1 book", "2-9 books", "10-49 books", "50+ books"]
+            values = [
+                single_book_authors,
+                multi_book_authors - prolific_authors,
+                prolific_authors - super_authors,
+                super_authors,
+            ]
+            plt.pie(values, labels=categories, autopct="%1.1f%%")
+            plt.title("Author Categories Distribution")
+
+            plt.subplot(2, 2, 4)
+            # Books per decade: JIT kernel fuses the NaN drop and the range mask
+            # (years are integral, so strict (1899, 2024) == inclusive [1900, 2023])
+            self.books_df["Year-Of-Publication"] = pd.to_numeric(
+                self.books_df["Year-Of-Publication"], errors="coerce"
+            )
+            year_raw = self.books_df["Year-Of-Publication"].to_numpy(
+                np.float64, na_value=np.nan
+            )
+            year_vals, year_ok = _clean_range(year_raw, 1899, 2024)
+            valid_years = pd.Series(year_vals[year_ok])
 
-        decade_counts = (valid_years // 10 * 10).value_counts().sort_index()
-        decade_counts.plot(kind="line", marker="o")
-        plt.title("Books Published by Decade")
-        plt.xlabel("Decade")
-        plt.ylabel("Number of Books")
+            decade_counts = (valid_years // 10 * 10).value_counts().sort_index()
+            decade_counts.plot(kind="line", marker="o")
+            plt.title("Books Published by Decade")
+            plt.xlabel("Decade")
+            plt.ylabel("Number of Books")
 
-        plt.tight_layout()
-        plt.savefig("author_tenant_analysis.png", dpi=300, bbox_inches="tight")
-        plt.show()
+            plt.tight_layout()
+            self._finish_figure("author_tenant_analysis.png")
 
         return author_stats
 
@@ -209,10 +431,12 @@ class BookRecommendationEDA:
         print(f"📊 USER DEMOGRAPHICS:")
         print(f"Total users: {len(self.users_df):,}")
 
-        # Age analysis
-        age_data = pd.to_numeric(self.users_df["Age"], errors="coerce")
-        valid_ages = age_data.dropna()
-        valid_ages = valid_ages[(valid_ages > 0) & (valid_ages < 120)]
+        # Age analysis: JIT kernel fuses the NaN drop and the range mask
+        age_raw = pd.to_numeric(self.users_df["Age"], errors="coerce").to_numpy(
+            np.float64, na_value=np.nan
+        )
+        age_vals, age_ok = _clean_range(age_raw, 0, 120)
+        valid_ages = pd.Series(age_vals[age_ok])
 
         print(f"\n🎂 AGE STATISTICS:")
         print(f"Users with valid age data: {len(valid_ages):,}")
@@ -225,84 +449,87 @@ class BookRecommendationEDA:
         print(f"\n🌍 LOCATION ANALYSIS:")
         print(f"Total unique locations: {len(location_stats):,}")
         print(f"\nTop 15 user locations:")
-        for i, (location, count) in enumerate(location_stats.head(15).items(), 1):
-            print(f"{i:2d}. {location:<40} : {count:5d} users")
-
-        # Country analysis (extract country from location)
-        countries = []
-        for location in self.users_df["Location"].fillna("Unknown"):
-            parts = str(location).split(",")
-            if len(parts) >= 2:
-                countries.append(parts[-1].strip().lower())
-            else:
-                countries.append("unknown")
+        self._print_lines(
+            f"{i:2d}. {location:<40} : {count:5d} users"
+            for i, (location, count) in enumerate(location_stats.head(15).items(), 1)
+        )
 
-        country_stats = pd.Series(countries).value_counts()
-        print(f"\n🏳️ TOP 10 COUNTRIES:")
-        for i, (country, count) in enumerate(country_stats.head(10).items(), 1):
-            print(f"{i:2d}. {country.title():<20} : {count:5d} users")
+        # Country analysis (extract country from location, vectorized)
+        loc = self.users_df["Location"].fillna("unknown").astype(str)
+        countries = (
+            loc.str.rsplit(",", n=1).str[-1].str.strip().str.lower()
+        ).where(loc.str.contains(",", regex=False), "unknown")
 
-        # Visualizations
-        plt.figure(figsize=(15, 10))
-
-        plt.subplot(2, 2, 1)
-        valid_ages.hist(bins=50, alpha=0.7)
-        plt.title("User Age Distribution")
-        plt.xlabel("Age")
-        plt.ylabel("Number of Users")
-
-        plt.subplot(2, 2, 2)
-        location_stats.head(15).plot(kind="barh")
-        plt.title("Top 15 User Locations")
-        plt.xlabel("Number of Users")
-
-        plt.subplot(2, 2, 3)
-        country_stats.head(10).plot(kind="bar")
-        plt.title("Top 10 Countries by User Count")
-        plt.xlabel("Country")
-        plt.ylabel("Number of Users")
-        plt.xticks(rotation=45)
-
-        plt.subplot(2, 2, 4)
-        # Age groups
-        age_groups = pd.cut(
-            valid_ages,
-            bins=[0, 18, 25, 35, 45, 55, 65, 100],
-            labels=["<18", "18-25", "26-35", "36-45", "46-55", "56-65", "65+"],
+        country_stats = countries.value_counts()
+        print(f"\n🏳️ TOP 10 COUNTRIES:")
+        self._print_lines(
+            f"{i:2d}. {country.title():<20} : {count:5d} users"
+            for i, (country, count) in enumerate(country_stats.head(10).items(), 1)
         )
-        age_groups.value_counts().plot(kind="pie", autopct="%1.1f%%")
-        plt.title("User Age Groups")
 
-        plt.tight_layout()
-        plt.savefig("user_analysis.png", dpi=300, bbox_inches="tight")
-        plt.show()
+        # Visualizations
+        if self.render:
+            plt.figure(figsize=(15, 10))
+
+            plt.subplot(2, 2, 1)
+            valid_ages.hist(bins=50, alpha=0.7)
+            plt.title("User Age Distribution")
+            plt.xlabel("Age")
+            plt.ylabel("Number of Users")
+
+            plt.subplot(2, 2, 2)
+            location_stats.head(15).plot(kind="barh")
+            plt.title("Top 15 User Locations")
+            plt.xlabel("Number of Users")
+
+            plt.subplot(2, 2, 3)
+            country_stats.head(10).plot(kind="bar")
+            plt.title("Top 10 Countries by User Count")
+            plt.xlabel("Country")
+            plt.ylabel("Number of Users")
+            plt.xticks(rotation=45)
+
+            plt.subplot(2, 2, 4)
+            # Age groups: searchsorted + bincount instead of pd.cut + value_counts
+            age_bins = np.array([0, 18, 25, 35, 45, 55, 65, 100], dtype=np.float64)
+            age_labels = ["<18", "18-25", "26-35", "36-45", "46-55", "56-65", "65+"]
+            age_codes = np.searchsorted(age_bins, valid_ages.to_numpy(), side="left") - 1
+            in_bins = (age_codes >= 0) & (age_codes < len(age_labels))
+            age_counts = np.bincount(age_codes[in_bins], minlength=len(age_labels))
+            plt.pie(age_counts, labels=age_labels, autopct="%1.1f%%")
+            plt.title("User Age Groups")
+
+            plt.tight_layout()
+            self._finish_figure("user_analysis.png")
 
     def analyze_ratings(self):
         """Analyze ratings dataset for recommendation insights"""
         print("\n⭐ RATING ANALYSIS")
         print("=" * 50)
 
+        user_activity = self._get_user_activity()
+        book_popularity = self._get_book_popularity()
+
         print(f"📊 RATING STATISTICS:")
-        print(f"Total ratings: {len(self.ratings_df):,}")
-        print(f"Unique users who rated: {self.ratings_df['User-ID'].nunique():,}")
-        print(f"Unique books rated: {self.ratings_df['ISBN'].nunique():,}")
+        print(f"Total ratings: {self._n_ratings:,}")
+        print(f"Unique users who rated: {len(user_activity):,}")
+        print(f"Unique books rated: {len(book_popularity):,}")
 
         # Rating distribution
-        rating_dist = self.ratings_df["Book-Rating"].value_counts().sort_index()
+        rating_dist = self._get_rating_dist()
         print(f"\n📈 RATING DISTRIBUTION:")
-        for rating, count in rating_dist.items():
-            percentage = count / len(self.ratings_df) * 100
-            print(f"Rating {rating}: {count:8,} ({percentage:5.1f}%)")
+        self._print_lines(
+            f"Rating {rating}: {count:8,} ({count / self._n_ratings * 100:5.1f}%)"
+            for rating, count in rating_dist.items()
+        )
 
         # User activity analysis
-        user_activity = self.ratings_df["User-ID"].value_counts()
         print(f"\n👤 USER ACTIVITY STATISTICS:")
         print(f"Average ratings per user: {user_activity.mean():.1f}")
         print(f"Median ratings per user: {user_activity.median():.0f}")
         print(f"Max ratings by single user: {user_activity.max():,}")
 
         # Book popularity analysis
-        book_popularity = self.ratings_df["ISBN"].value_counts()
         print(f"\n📚 BOOK POPULARITY STATISTICS:")
         print(f"Average ratings per book: {book_popularity.mean():.1f}")
         print(f"Median ratings per book: {book_popularity.median():.0f}")
@@ -317,69 +544,76 @@ class BookRecommendationEDA:
         print(f"Popular books (20+ ratings): {len(popular_books):,}")
 
         # Rating patterns
-        plt.figure(figsize=(15, 12))
-
-        plt.subplot(2, 3, 1)
-        rating_dist.plot(kind="bar")
-        plt.title("Rating Distribution")
-        plt.xlabel("Rating")
-        plt.ylabel("Count")
-
-        plt.subplot(2, 3, 2)
-        user_activity.head(20).plot(kind="bar")
-        plt.title("Top 20 Most Active Users")
-        plt.xlabel("User ID")
-        plt.ylabel("Number of Ratings")
-        plt.xticks(rotation=45)
-
-        plt.subplot(2, 3, 3)
-        book_popularity.head(20).plot(kind="bar")
-        plt.title("Top 20 Most Rated Books")
-        plt.xlabel("ISBN")
-        plt.ylabel("Number of Ratings")
-        plt.xticks(rotation=45)
-
-        plt.subplot(2, 3, 4)
-        # User activity distribution
-        activity_ranges = [1, 2, 5, 10, 20, 50, 100, float("inf")]
-        activity_labels = ["1", "2-4", "5-9", "10-19", "20-49", "50-99", "100+"]
-        user_activity_groups = pd.cut(
-            user_activity, bins=activity_ranges, labels=activity_labels, right=False
-        )
-        user_activity_groups.value_counts().plot(kind="bar")
-        plt.title("User Activity Distribution")
-        plt.xlabel("Number of Ratings")
-        plt.ylabel("Number of Users")
-
-        plt.subplot(2, 3, 5)
-        # Book rating distribution
-        book_rating_groups = pd.cut(
-            book_popularity, bins=activity_ranges, labels=activity_labels, right=False
-        )
-        book_rating_groups.value_counts().plot(kind="bar")
-        plt.title("Book Rating Count Distribution")
-        plt.xlabel("Number of Ratings Received")
-        plt.ylabel("Number of Books")
-
-        plt.subplot(2, 3, 6)
-        # Rating over time (if we merge with publication year)
-        non_zero_ratings = self.ratings_df[self.ratings_df["Book-Rating"] > 0]
-        avg_rating = non_zero_ratings["Book-Rating"].mean()
-        plt.axhline(
-            y=avg_rating,
-            color="red",
-            linestyle="--",
-            label=f"Average Rating: {avg_rating:.2f}",
-        )
-        plt.hist(non_zero_ratings["Book-Rating"], bins=20, alpha=0.7)
-        plt.title("Non-Zero Ratings Distribution")
-        plt.xlabel("Rating")
-        plt.ylabel("Frequency")
-        plt.legend()
+        if self.render:
+            plt.figure(figsize=(15, 12))
+
+            plt.subplot(2, 3, 1)
+            rating_dist.plot(kind="bar")
+            plt.title("Rating Distribution")
+            plt.xlabel("Rating")
+            plt.ylabel("Count")
+
+            plt.subplot(2, 3, 2)
+            user_activity.head(20).plot(kind="bar")
+            plt.title("Top 20 Most Active Users")
+            plt.xlabel("User ID")
+            plt.ylabel("Number of Ratings")
+            plt.xticks(rotation=45)
+
+            plt.subplot(2, 3, 3)
+            book_popularity.head(20).plot(kind="bar")
+            plt.title("Top 20 Most Rated Books")
+            plt.xlabel("ISBN")
+            plt.ylabel("Number of Ratings")
+            plt.xticks(rotation=45)
+
+            plt.subplot(2, 3, 4)
+            # User activity distribution: bincount on quantized codes (bins are
+            # left-closed, so side="right" reproduces pd.cut(..., right=False))
+            activity_bins = np.array([1, 2, 5, 10, 20, 50, 100])
+            activity_labels = ["1", "2-4", "5-9", "10-19", "20-49", "50-99", "100+"]
+            user_codes = np.searchsorted(
+                activity_bins, user_activity.to_numpy(), side="right"
+            ) - 1
+            user_counts = np.bincount(user_codes, minlength=len(activity_labels))
+            plt.bar(activity_labels, user_counts)
+            plt.title("User Activity Distribution")
+            plt.xlabel("Number of Ratings")
+            plt.ylabel("Number of Users")
+
+            plt.subplot(2, 3, 5)
+            # Book rating distribution
+            book_codes = np.searchsorted(
+                activity_bins, book_popularity.to_numpy(), side="right"
+            ) - 1
+            book_counts = np.bincount(book_codes, minlength=len(activity_labels))
+            plt.bar(activity_labels, book_counts)
+            plt.title("Book Rating Count Distribution")
+            plt.xlabel("Number of Ratings Received")
+            plt.ylabel("Number of Books")
+
+            plt.subplot(2, 3, 6)
+            # Non-zero ratings reconstructed from the distribution, which
+            # is available in both the in-memory and streaming modes
+            non_zero_dist = rating_dist[rating_dist.index > 0]
+            non_zero_values = np.repeat(
+                non_zero_dist.index.to_numpy(), non_zero_dist.to_numpy()
+            )
+            avg_rating = non_zero_values.mean()
+            plt.axhline(
+                y=avg_rating,
+                color="red",
+                linestyle="--",
+                label=f"Average Rating: {avg_rating:.2f}",
+            )
+            plt.hist(non_zero_values, bins=20, alpha=0.7)
+            plt.title("Non-Zero Ratings Distribution")
+            plt.xlabel("Rating")
+            plt.ylabel("Frequency")
+            plt.legend()
 
-        plt.tight_layout()
-        plt.savefig("rating_analysis.png", dpi=300, bbox_inches="tight")
-        plt.show()
+            plt.tight_layout()
+            self._finish_figure("rating_analysis.png")
 
         return user_activity, book_popularity
 
@@ -388,32 +622,90 @@ class BookRecommendationEDA:
         print("\n🔄 MERGED DATASET ANALYSIS")
         print("=" * 50)
 
-        # Merge ratings with books
-        ratings_books = self.ratings_df.merge(self.books_df, on="ISBN", how="left")
+        # Unify the ISBN dictionaries so the join runs on int codes
+        if self.streaming:
+            rated_isbns = pd.Index(self._per_isbn_moments.index)
+        else:
+            rated_isbns = self.ratings_df["ISBN"].cat.categories
+        isbn_dtype = pd.CategoricalDtype(
+            rated_isbns.union(self.books_df["ISBN"].cat.categories)
+        )
 
-        # Filter only rated books (ratings > 0)
-        rated_books = ratings_books[ratings_books["Book-Rating"] > 0]
+        # Pre-aggregate ratings per ISBN first (count / sum / sum-of-squares
+        # moments), then join the ~340k-row aggregate to books. This avoids
+        # materializing the author/publisher/title strings once per rating
+        # row in a full 1.1M-row merge; mean and std are recovered from the
+        # moments at the author/publisher level.
+        if self.streaming:
+            # The moments were already reduced during the chunked load
+            # scan; see _stream_ratings_aggregate
+            per_isbn = self._per_isbn_moments.set_axis(
+                pd.CategoricalIndex(self._per_isbn_moments.index, dtype=isbn_dtype)
+            )
+        else:
+            rated = self.rated_ratings_df
+            rated = rated.assign(
+                ISBN=rated["ISBN"].astype(isbn_dtype),
+                rating_sq=rated["Book-Rating"].astype("float64") ** 2,
+            )
+            if _HAS_GPU:
+                # GPU hash group-by on the rating rows, pandas only sees
+                # the small per-ISBN aggregate coming back
+                per_isbn = (
+                    cudf.from_pandas(rated[["ISBN", "Book-Rating", "rating_sq"]])
+                    .groupby("ISBN")
+                    .agg({"Book-Rating": ["size", "sum"], "rating_sq": "sum"})
+                    .to_pandas()
+                )
+                per_isbn.columns = ["n", "s", "s2"]
+            else:
+                per_isbn = rated.groupby("ISBN", observed=True, sort=False).agg(
+                    n=("Book-Rating", "size"),
+                    s=("Book-Rating", "sum"),
+                    s2=("rating_sq", "sum"),
+                )
+        merged = per_isbn.join(
+            self.books_df.assign(
+                ISBN=self.books_df["ISBN"].astype(isbn_dtype)
+            ).set_index("ISBN")[["Book-Author", "Publisher", "Year-Of-Publication"]],
+            how="inner",
+        )
+
+        total_pairs = self._n_ratings
+        rated_count = self._n_active_ratings
 
         print(f"📊 MERGED STATISTICS:")
-        print(f"Total rating-book combinations: {len(ratings_books):,}")
-        print(f"Actual ratings (>0): {len(rated_books):,}")
-        print(
-            f"Implicit feedback (rating=0): {len(ratings_books) - len(rated_books):,}"
+        print(f"Total rating-book combinations: {total_pairs:,}")
+        print(f"Actual ratings (>0): {rated_count:,}")
+        print(f"Implicit feedback (rating=0): {total_pairs - rated_count:,}")
+
+        # Author performance analysis (key for tenant insights).
+        # Named aggs on the categorical key: one pass per axis, flat columns,
+        # observed=True so unseen categories don't produce empty groups.
+        # Mean/std come from the per-ISBN moments (sample std, ddof=1).
+        author_performance = merged.groupby(
+            "Book-Author", observed=True, sort=False
+        ).agg(
+            Total_Ratings=("n", "sum"),
+            Rating_Sum=("s", "sum"),
+            Rating_SumSq=("s2", "sum"),
+            Unique_Books=("n", "size"),
         )
-
-        # Author performance analysis (key for tenant insights)
-        author_performance = (
-            rated_books.groupby("Book-Author")
-            .agg({"Book-Rating": ["count", "mean", "std"], "ISBN": "nunique"})
-            .round(2)
+        author_performance["Avg_Rating"] = (
+            author_performance["Rating_Sum"] / author_performance["Total_Ratings"]
         )
+        author_performance["Rating_Std"] = np.sqrt(
+            (
+                author_performance["Rating_SumSq"]
+                - author_performance["Rating_Sum"] ** 2
+                / author_performance["Total_Ratings"]
+            )
+            / (author_performance["Total_Ratings"] - 1)
+        )
+        author_performance = author_performance[
+            ["Total_Ratings", "Avg_Rating", "Rating_Std", "Unique_Books"]
+        ].round(2)
 
-        author_performance.columns = [
-            "Total_Ratings",
-            "Avg_Rating",
-            "Rating_Std",
-            "Unique_Books",
-        ]
         author_performance = author_performance[
             author_performance["Total_Ratings"] >= 10
         ]
@@ -422,130 +714,140 @@ class BookRecommendationEDA:
         )
 
         print(f"\n🏆 TOP 20 AUTHORS BY TOTAL RATINGS (Best Tenant Candidates):")
-        for i, (author, data) in enumerate(author_performance.head(20).iterrows(), 1):
-            print(
-                f"{i:2d}. {author:<30}: {data['Total_Ratings']:5.0f} ratings, "
-                f"{data['Avg_Rating']:.2f} avg, {data['Unique_Books']:3.0f} books"
+        self._print_lines(
+            f"{i:2d}. {author:<30}: {data['Total_Ratings']:5.0f} ratings, "
+            f"{data['Avg_Rating']:.2f} avg, {data['Unique_Books']:3.0f} books"
+            for i, (author, data) in enumerate(
+                author_performance.head(20).iterrows(), 1
             )
+        )
 
         # Best rated authors (minimum 50 ratings for significance)
         best_rated = author_performance[author_performance["Total_Ratings"] >= 50]
         best_rated = best_rated.sort_values("Avg_Rating", ascending=False)
 
         print(f"\n⭐ TOP 15 HIGHEST RATED AUTHORS (50+ ratings):")
-        for i, (author, data) in enumerate(best_rated.head(15).iterrows(), 1):
-            print(
-                f"{i:2d}. {author:<30}: {data['Avg_Rating']:.2f} avg "
-                f"({data['Total_Ratings']:4.0f} ratings)"
-            )
+        self._print_lines(
+            f"{i:2d}. {author:<30}: {data['Avg_Rating']:.2f} avg "
+            f"({data['Total_Ratings']:4.0f} ratings)"
+            for i, (author, data) in enumerate(best_rated.head(15).iterrows(), 1)
+        )
 
         # Publisher analysis
-        publisher_stats = (
-            rated_books.groupby("Publisher")
-            .agg({"Book-Rating": ["count", "mean"], "Book-Author": "nunique"})
-            .round(2)
+        publisher_stats = merged.groupby("Publisher", observed=True, sort=False).agg(
+            Total_Ratings=("n", "sum"),
+            Rating_Sum=("s", "sum"),
+            Unique_Authors=("Book-Author", "nunique"),
+        )
+        publisher_stats["Avg_Rating"] = (
+            publisher_stats["Rating_Sum"] / publisher_stats["Total_Ratings"]
         )
-        publisher_stats.columns = ["Total_Ratings", "Avg_Rating", "Unique_Authors"]
+        publisher_stats = publisher_stats[
+            ["Total_Ratings", "Avg_Rating", "Unique_Authors"]
+        ].round(2)
         publisher_stats = publisher_stats[publisher_stats["Total_Ratings"] >= 100]
         publisher_stats = publisher_stats.sort_values("Total_Ratings", ascending=False)
 
         print(f"\n📖 TOP 15 PUBLISHERS BY RATINGS:")
-        for i, (publisher, data) in enumerate(publisher_stats.head(15).iterrows(), 1):
-            print(
-                f"{i:2d}. {publisher:<35}: {data['Total_Ratings']:5.0f} ratings, "
-                f"{data['Avg_Rating']:.2f} avg"
+        self._print_lines(
+            f"{i:2d}. {publisher:<35}: {data['Total_Ratings']:5.0f} ratings, "
+            f"{data['Avg_Rating']:.2f} avg"
+            for i, (publisher, data) in enumerate(
+                publisher_stats.head(15).iterrows(), 1
             )
-
-        # Year analysis
-        rated_books["Year-Of-Publication"] = pd.to_numeric(
-            rated_books["Year-Of-Publication"], errors="coerce"
         )
-        valid_year_ratings = rated_books.dropna(subset=["Year-Of-Publication"])
-        valid_year_ratings = valid_year_ratings[
-            (valid_year_ratings["Year-Of-Publication"] >= 1950)
-            & (valid_year_ratings["Year-Of-Publication"] <= 2023)
-        ]
 
-        year_stats = (
-            valid_year_ratings.groupby("Year-Of-Publication")
-            .agg({"Book-Rating": ["count", "mean"]})
-            .round(2)
+        # Year analysis (per-ISBN moments weighted by rating count)
+        merged["Year-Of-Publication"] = pd.to_numeric(
+            merged["Year-Of-Publication"], errors="coerce"
+        )
+        # numexpr fuses both comparisons and the NaN drop into one pass
+        valid_year_ratings = merged.query(
+            "1950 <= `Year-Of-Publication` <= 2023", engine="numexpr"
         )
-        year_stats.columns = ["Rating_Count", "Avg_Rating"]
+
+        # sort stays on here: the line plots rely on year-ordered output
+        year_stats = valid_year_ratings.groupby(
+            "Year-Of-Publication", observed=True
+        ).agg(Rating_Count=("n", "sum"), Rating_Sum=("s", "sum"))
+        year_stats["Avg_Rating"] = (
+            year_stats["Rating_Sum"] / year_stats["Rating_Count"]
+        ).round(2)
+        year_stats = year_stats[["Rating_Count", "Avg_Rating"]]
 
         # Visualizations
-        plt.figure(figsize=(20, 15))
-
-        plt.subplot(3, 3, 1)
-        author_performance.head(15)["Total_Ratings"].plot(kind="barh")
-        plt.title("Top 15 Authors by Total Ratings")
-        plt.xlabel("Total Ratings")
-
-        plt.subplot(3, 3, 2)
-        best_rated.head(15)["Avg_Rating"].plot(kind="barh")
-        plt.title("Top 15 Authors by Average Rating")
-        plt.xlabel("Average Rating")
-
-        plt.subplot(3, 3, 3)
-        publisher_stats.head(10)["Total_Ratings"].plot(kind="barh")
-        plt.title("Top 10 Publishers by Total Ratings")
-        plt.xlabel("Total Ratings")
-
-        plt.subplot(3, 3, 4)
-        # Author rating distribution
-        plt.scatter(
-            author_performance["Total_Ratings"],
-            author_performance["Avg_Rating"],
-            alpha=0.6,
-        )
-        plt.xlabel("Total Ratings")
-        plt.ylabel("Average Rating")
-        plt.title("Author Performance: Total vs Average Rating")
-        plt.xscale("log")
-
-        plt.subplot(3, 3, 5)
-        # Year trend
-        year_stats["Rating_Count"].plot(kind="line")
-        plt.title("Ratings Count by Publication Year")
-        plt.xlabel("Year")
-        plt.ylabel("Number of Ratings")
-
-        plt.subplot(3, 3, 6)
-        year_stats["Avg_Rating"].plot(kind="line", color="orange")
-        plt.title("Average Rating by Publication Year")
-        plt.xlabel("Year")
-        plt.ylabel("Average Rating")
-
-        plt.subplot(3, 3, 7)
-        # Books per author distribution
-        author_performance["Unique_Books"].hist(bins=30, alpha=0.7)
-        plt.title("Distribution: Books per Author")
-        plt.xlabel("Number of Unique Books")
-        plt.ylabel("Number of Authors")
-
-        plt.subplot(3, 3, 8)
-        # Rating spread by author
-        author_performance["Rating_Std"].hist(bins=30, alpha=0.7, color="green")
-        plt.title("Rating Standard Deviation by Author")
-        plt.xlabel("Standard Deviation")
-        plt.ylabel("Number of Authors")
-
-        plt.subplot(3, 3, 9)
-        # Publisher performance
-        plt.scatter(
-            publisher_stats["Total_Ratings"],
-            publisher_stats["Avg_Rating"],
-            alpha=0.6,
-            color="red",
-        )
-        plt.xlabel("Total Ratings")
-        plt.ylabel("Average Rating")
-        plt.title("Publisher Performance")
-        plt.xscale("log")
+        if self.render:
+            plt.figure(figsize=(20, 15))
+
+            plt.subplot(3, 3, 1)
+            author_performance.head(15)["Total_Ratings"].plot(kind="barh")
+            plt.title("Top 15 Authors by Total Ratings")
+            plt.xlabel("Total Ratings")
+
+            plt.subplot(3, 3, 2)
+            best_rated.head(15)["Avg_Rating"].plot(kind="barh")
+            plt.title("Top 15 Authors by Average Rating")
+            plt.xlabel("Average Rating")
+
+            plt.subplot(3, 3, 3)
+            publisher_stats.head(10)["Total_Ratings"].plot(kind="barh")
+            plt.title("Top 10 Publishers by Total Ratings")
+            plt.xlabel("Total Ratings")
+
+            plt.subplot(3, 3, 4)
+            # Author rating distribution
+            plt.scatter(
+                author_performance["Total_Ratings"],
+                author_performance["Avg_Rating"],
+                alpha=0.6,
+            )
+            plt.xlabel("Total Ratings")
+            plt.ylabel("Average Rating")
+            plt.title("Author Performance: Total vs Average Rating")
+            plt.xscale("log")
+
+            plt.subplot(3, 3, 5)
+            # Year trend
+            year_stats["Rating_Count"].plot(kind="line")
+            plt.title("Ratings Count by Publication Year")
+            plt.xlabel("Year")
+            plt.ylabel("Number of Ratings")
+
+            plt.subplot(3, 3, 6)
+            year_stats["Avg_Rating"].plot(kind="line", color="orange")
+            plt.title("Average Rating by Publication Year")
+            plt.xlabel("Year")
+            plt.ylabel("Average Rating")
+
+            plt.subplot(3, 3, 7)
+            # Books per author distribution
+            author_performance["Unique_Books"].hist(bins=30, alpha=0.7)
+            plt.title("Distribution: Books per Author")
+            plt.xlabel("Number of Unique Books")
+            plt.ylabel("Number of Authors")
+
+            plt.subplot(3, 3, 8)
+            # Rating spread by author
+            author_performance["Rating_Std"].hist(bins=30, alpha=0.7, color="green")
+            plt.title("Rating Standard Deviation by Author")
+            plt.xlabel("Standard Deviation")
+            plt.ylabel("Number of Authors")
+
+            plt.subplot(3, 3, 9)
+            # Publisher performance
+            plt.scatter(
+                publisher_stats["Total_Ratings"],
+                publisher_stats["Avg_Rating"],
+                alpha=0.6,
+                color="red",
+            )
+            plt.xlabel("Total Ratings")
+            plt.ylabel("Average Rating")
+            plt.title("Publisher Performance")
+            plt.xscale("log")
 
-        plt.tight_layout()
-        plt.savefig("merged_analysis.png", dpi=300, bbox_inches="tight")
-        plt.show()
+            plt.tight_layout()
+            self._finish_figure("merged_analysis.png")
 
         return author_performance, publisher_stats
 
@@ -554,52 +856,50 @@ class BookRecommendationEDA:
         print("\n🎯 TENANT SELECTION RECOMMENDATIONS")
         print("=" * 50)
 
-        # Tier 1: Premium tenants (high volume + high quality)
-        tier1 = author_performance[
-            (author_performance["Total_Ratings"] >= 1000)
-            & (author_performance["Avg_Rating"] >= 7.5)
-        ]
+        # Tier each author in one vectorized pass; np.select's first-match-wins
+        # keeps the tiers mutually exclusive without any index.isin scans
+        total_ratings = author_performance["Total_Ratings"].to_numpy()
+        avg_rating = author_performance["Avg_Rating"].to_numpy()
+        tier = np.select(
+            [
+                # Tier 1: Premium tenants (high volume + high quality)
+                (total_ratings >= 1000) & (avg_rating >= 7.5),
+                # Tier 2: High potential tenants (good volume or quality)
+                (total_ratings >= 500) & (avg_rating >= 7.0),
+                # Tier 3: Growing tenants (decent activity)
+                (total_ratings >= 100) & (avg_rating >= 6.5),
+            ],
+            [1, 2, 3],
+            default=0,
+        )
 
-        # Tier 2: High potential tenants (good volume or quality)
-        tier2 = author_performance[
-            (
-                (author_performance["Total_Ratings"] >= 500)
-                & (author_performance["Avg_Rating"] >= 7.0)
-            )
-            & (~author_performance.index.isin(tier1.index))
-        ]
-
-        # Tier 3: Growing tenants (decent activity)
-        tier3 = author_performance[
-            (author_performance["Total_Ratings"] >= 100)
-            & (author_performance["Avg_Rating"] >= 6.5)
-            & (~author_performance.index.isin(tier1.index))
-            & (~author_performance.index.isin(tier2.index))
-        ]
+        tier1 = author_performance[tier == 1]
+        tier2 = author_performance[tier == 2]
+        tier3 = author_performance[tier == 3]
 
         print(f"🏆 TIER 1 - PREMIUM TENANTS ({len(tier1)} authors):")
         print("   Criteria: 1000+ ratings AND 7.5+ average rating")
-        for author, data in tier1.head(10).iterrows():
-            print(
-                f"   • {author:<35}: {data['Total_Ratings']:5.0f} ratings, "
-                f"{data['Avg_Rating']:.2f} avg"
-            )
+        self._print_lines(
+            f"   • {author:<35}: {data['Total_Ratings']:5.0f} ratings, "
+            f"{data['Avg_Rating']:.2f} avg"
+            for author, data in tier1.head(10).iterrows()
+        )
 
         print(f"\n🚀 TIER 2 - HIGH POTENTIAL TENANTS ({len(tier2)} authors):")
         print("   Criteria: 500+ ratings AND 7.0+ average rating")
-        for author, data in tier2.head(10).iterrows():
-            print(
-                f"   • {author:<35}: {data['Total_Ratings']:5.0f} ratings, "
-                f"{data['Avg_Rating']:.2f} avg"
-            )
+        self._print_lines(
+            f"   • {author:<35}: {data['Total_Ratings']:5.0f} ratings, "
+            f"{data['Avg_Rating']:.2f} avg"
+            for author, data in tier2.head(10).iterrows()
+        )
 
         print(f"\n📈 TIER 3 - GROWING TENANTS ({len(tier3)} authors):")
         print("   Criteria: 100+ ratings AND 6.5+ average rating")
-        for author, data in tier3.head(10).iterrows():
-            print(
-                f"   • {author:<35}: {data['Total_Ratings']:5.0f} ratings, "
-                f"{data['Avg_Rating']:.2f} avg"
-            )
+        self._print_lines(
+            f"   • {author:<35}: {data['Total_Ratings']:5.0f} ratings, "
+            f"{data['Avg_Rating']:.2f} avg"
+            for author, data in tier3.head(10).iterrows()
+        )
 
         # Business insights
         print(f"\n💡 BUSINESS INSIGHTS:")
@@ -632,8 +932,8 @@ class BookRecommendationEDA:
         # Dataset overview
         total_books = len(self.books_df)
         total_users = len(self.users_df)
-        total_ratings = len(self.ratings_df)
-        unique_authors = self.books_df["Book-Author"].nunique()
+        total_ratings = self._n_ratings
+        unique_authors = len(self._get_author_stats())
 
         print(f"📊 DATASET SCALE:")
         print(f"   • Total Books: {total_books:,}")
@@ -642,14 +942,8 @@ class BookRecommendationEDA:
         print(f"   • Unique Authors (Potential Tenants): {unique_authors:,}")
 
         # Data quality
-        book_missing_pct = (
-            self.books_df.isnull().sum().sum()
-            / (len(self.books_df) * len(self.books_df.columns))
-        ) * 100
-        user_missing_pct = (
-            self.users_df.isnull().sum().sum()
-            / (len(self.users_df) * len(self.users_df.columns))
-        ) * 100
+        book_missing_pct = _missing_pct(self.books_df)
+        user_missing_pct = _missing_pct(self.users_df)
 
         print(f"\n🎯 DATA QUALITY:")
         print(f"   • Books dataset completeness: {100-book_missing_pct:.1f}%")
@@ -657,7 +951,7 @@ class BookRecommendationEDA:
         print(f"   • Ratings dataset completeness: 100.0%")
 
         # Business viability
-        active_ratings = len(self.ratings_df[self.ratings_df["Book-Rating"] > 0])
+        active_ratings = self._n_active_ratings
         engagement_rate = (active_ratings / total_ratings) * 100
 
         print(f"\n📈 BUSINESS VIABILITY:")
@@ -728,10 +1022,26 @@ if __name__ == "__main__":
     # Run complete analysis
     results = eda.run_complete_analysis()
 
-    # Optional: Save results
-    import pickle
+    # Optional: Save results (Arrow-columnar parquet for the frames,
+    # plain JSON for the scalar summary)
+    if results:
+        import json
+
+        import pyarrow as pa
+        import pyarrow.parquet as pq
 
-    with open("book_eda_results.pkl", "wb") as f:
-        pickle.dump(results, f)
+        frames = {
+            "author_performance": results["author_performance"],
+            "publisher_stats": results["publisher_stats"],
+            **results["tenant_tiers"],
+        }
+        for name, df in frames.items():
+            pq.write_table(
+                pa.Table.from_pandas(df.reset_index()),
+                f"{name}.parquet",
+                compression="zstd",
+            )
+        with open("summary.json", "w") as f:
+            json.dump(results["summary"], f, indent=2)
 
-    print("📊 Analysis results saved to 'book_eda_results.pkl'")
+        print("📊 Analysis results saved to '*.parquet' and 'summary.json'")